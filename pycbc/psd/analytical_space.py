@@ -30,10 +30,158 @@ paper <10.1088/1361-6382/ab1101>, <10.1088/0264-9381/33/3/035010>,
 and <10.1103/PhysRevD.107.064021>.
 """
 
+import functools
 import numpy as np
 from scipy.interpolate import interp1d
+try:
+    import numexpr
+except ImportError:
+    numexpr = None
 from astropy.constants import c
 from pycbc.psd.read import from_numpy_arrays
+from pycbc.types import FrequencySeries
+
+# Plain float copies of the constants used in every noise and response
+# expression, so they are not looked up on the astropy Constant each call.
+_C = float(c.value)
+_TWO_PI = 2.0*np.pi
+
+# Change to True in front-end if you want the analytical TDI PSDs to be
+# memoized, e.g. for a likelihood with fixed noise. Every cached entry holds
+# a full FrequencySeries, so this is off by default.
+USE_CACHING_FOR_TDI_PSDS = False
+
+
+def _as_float(value):
+    """ Convert a scalar parameter to a plain float, so that it stays a
+    cheap scalar in the array expressions. Arrays are returned unchanged.
+
+    Parameters
+    ----------
+    value : float or numpy.array
+        The parameter.
+
+    Returns
+    -------
+    value : float or numpy.array
+        The parameter as a float, or the array itself.
+    """
+    if np.ndim(value) == 0:
+        return float(value)
+
+    return value
+
+
+def _frequency_grid(length, delta_f, low_freq_cutoff):
+    """ The frequency samples used to evaluate the analytical models,
+    one per output frequency bin from the low-frequency cutoff upwards.
+
+    Parameters
+    ----------
+    length : int
+        Length of output Frequencyseries.
+    delta_f : float
+        Frequency step for output FrequencySeries.
+    low_freq_cutoff : float
+        Low-frequency cutoff for output FrequencySeries.
+
+    Returns
+    -------
+    fr : numpy.array
+        The frequencies of the output bins kmin, ..., length-1, with
+        kmin = int(low_freq_cutoff/delta_f). As in `from_numpy_arrays`,
+        bin kmin takes the value at `low_freq_cutoff` itself, which keeps
+        the models finite at zero frequency and when `low_freq_cutoff`
+        is not a multiple of `delta_f`.
+    """
+    kmin = int(low_freq_cutoff / delta_f)
+    fr = np.arange(kmin, length, dtype=np.float64)*delta_f
+    fr[:1] = low_freq_cutoff
+
+    return fr
+
+
+def _fseries_on_grid(data, length, delta_f, low_freq_cutoff, fr=None,
+                     log=True):
+    """ Wrap values evaluated on the grid from `_frequency_grid` in a
+    FrequencySeries, zero below the low-frequency cutoff. As the grid is
+    made of the output bins, no interpolation is needed, which also makes
+    this work for quantities which can be negative, such as a CSD.
+
+    Parameters
+    ----------
+    data : numpy.array
+        The values on the grid from `_frequency_grid`, or on `fr`.
+    length : int
+        Length of output Frequencyseries.
+    delta_f : float
+        Frequency step for output FrequencySeries.
+    low_freq_cutoff : float
+        Low-frequency cutoff for output FrequencySeries.
+    fr : numpy.array
+        The frequencies of `data`, if they are not the grid from
+        `_frequency_grid`. The data are then interpolated onto the
+        output bins.
+    log : bool
+        Whether to interpolate in log space, with `from_numpy_arrays`.
+        Set to False for data which can be negative, such as a CSD, to
+        interpolate linearly instead.
+
+    Returns
+    -------
+    fseries : FrequencySeries
+        The values on the output frequency bins.
+    """
+    if fr is not None and log:
+        return from_numpy_arrays(fr, data, length, delta_f, low_freq_cutoff)
+    kmin = int(low_freq_cutoff / delta_f)
+    if fr is not None:
+        data = np.interp(_frequency_grid(length, delta_f, low_freq_cutoff),
+                         fr, data)
+    fseries_data = np.zeros(length, dtype=np.float64)
+    fseries_data[kmin:] = data
+    fseries = FrequencySeries(fseries_data, delta_f=delta_f)
+
+    return fseries
+
+
+def _memoize_fseries(func):
+    """ Cache the FrequencySeries returned by an analytical model, for the
+    common case (e.g. a likelihood with fixed noise) where it is requested
+    repeatedly with the same arguments. Only active when
+    `USE_CACHING_FOR_TDI_PSDS` is True. Each call returns a copy, as
+    callers may modify the result in place; the cached data itself is made
+    read-only to catch any aliasing. Calls with unhashable arguments are
+    not cached.
+
+    Parameters
+    ----------
+    func : function
+        The model, taking (length, delta_f, low_freq_cutoff, ...).
+
+    Returns
+    -------
+    wrapper : function
+        The memoized model. `wrapper.cache_clear` empties the cache.
+    """
+    @functools.lru_cache(maxsize=32)
+    def cached(*args, **kwargs):
+        fseries = func(*args, **kwargs)
+        fseries.numpy().flags.writeable = False
+        return fseries
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not USE_CACHING_FOR_TDI_PSDS:
+            return func(*args, **kwargs)
+        try:
+            hash((args, tuple(sorted(kwargs.items()))))
+        except TypeError:
+            return func(*args, **kwargs)
+        return cached(*args, **kwargs).copy()
+
+    wrapper.cache_clear = cached.cache_clear
+    return wrapper
 
 
 def _psd_acc_noise(f, acc_noise_level=None):
@@ -57,9 +205,16 @@ def _psd_acc_noise(f, acc_noise_level=None):
     -----
         Please see Eq.(11-13) in <LISA-LCST-SGS-TN-001> for more details.
     """
-    s_acc = acc_noise_level**2 * (1+(4e-4/f)**2)*(1+(f/8e-3)**4)
-    s_acc_d = s_acc * (2*np.pi*f)**(-4)
-    s_acc_nu = (2*np.pi*f/c.value)**2 * s_acc_d
+    # s_acc * (2*pi*f)**(-4) * (2*pi*f/c)**2, with the constant factors
+    # collected into one scalar so the array is traversed in one chain.
+    # Powers are written as products of 1/f and f/8e-3 = f*125, which
+    # avoids repeated divisions and the generic pow.
+    inv_f = 1/f
+    low_f = 4e-4*inv_f
+    high_f = f*125.
+    high_f *= high_f
+    s_acc_nu = ((acc_noise_level/(_TWO_PI*_C))**2 *
+                (1+low_f*low_f)*(1+high_f*high_f) * (inv_f*inv_f))
 
     return s_acc_nu
 
@@ -106,8 +261,9 @@ def psd_tianqin_acc_noise(f, acc_noise_level=1e-15):
         Please see Table(1) in <10.1088/0264-9381/33/3/035010>
         and that paper for more details.
     """
-    s_acc_d = acc_noise_level**2 * (2*np.pi*f)**(-4) * (1+1e-4/f)
-    s_acc_nu = (2*np.pi*f/c.value)**2 * s_acc_d
+    inv_f = 1/f
+    s_acc_nu = ((acc_noise_level/(_TWO_PI*_C))**2 *
+                (1+1e-4*inv_f) * (inv_f*inv_f))
 
     return s_acc_nu
 
@@ -155,8 +311,9 @@ def _psd_oms_noise(f, oms_noise_level=None):
     -----
         Please see Eq.(9-10) in <LISA-LCST-SGS-TN-001> for more details.
     """
-    s_oms_d = oms_noise_level**2 * (1+(2e-3/f)**4)
-    s_oms_nu = s_oms_d * (2*np.pi*f/c.value)**2
+    low_f = 2e-3/f
+    low_f *= low_f
+    s_oms_nu = (oms_noise_level*_TWO_PI/_C)**2 * (1+low_f*low_f) * (f*f)
 
     return s_oms_nu
 
@@ -203,8 +360,7 @@ def psd_tianqin_oms_noise(f, oms_noise_level=1e-12):
         Please see Table(1) in <10.1088/0264-9381/33/3/035010>
         and that paper for more details.
     """
-    s_oms_d = oms_noise_level**2
-    s_oms_nu = s_oms_d * (2*np.pi*f/c.value)**2
+    s_oms_nu = (oms_noise_level*_TWO_PI/_C)**2 * (f*f)
 
     return s_oms_nu
 
@@ -239,9 +395,9 @@ def lisa_psd_components(f, acc_noise_level=3e-15, oms_noise_level=15e-12):
     ----------
     f : float or numpy.array
         The frequency or frequency range, in the unit of "Hz".
-    acc_noise_level : float
+    acc_noise_level : float or numpy.array
         The level of acceleration noise.
-    oms_noise_level : float
+    oms_noise_level : float or numpy.array
         The level of OMS noise.
 
     Returns
@@ -249,8 +405,8 @@ def lisa_psd_components(f, acc_noise_level=3e-15, oms_noise_level=15e-12):
     low_freq_component, high_freq_component :
         The PSD value or array for acceleration and OMS noise.
     """
-    acc_noise_level = np.float64(acc_noise_level)
-    oms_noise_level = np.float64(oms_noise_level)
+    acc_noise_level = _as_float(acc_noise_level)
+    oms_noise_level = _as_float(oms_noise_level)
     low_freq_component = psd_lisa_acc_noise(f, acc_noise_level)
     high_freq_component = psd_lisa_oms_noise(f, oms_noise_level)
 
@@ -264,9 +420,9 @@ def tianqin_psd_components(f, acc_noise_level=1e-15, oms_noise_level=1e-12):
     ----------
     f : float or numpy.array
         The frequency or frequency range, in the unit of "Hz".
-    acc_noise_level : float
+    acc_noise_level : float or numpy.array
         The level of acceleration noise.
-    oms_noise_level : float
+    oms_noise_level : float or numpy.array
         The level of OMS noise.
 
     Returns
@@ -274,8 +430,8 @@ def tianqin_psd_components(f, acc_noise_level=1e-15, oms_noise_level=1e-12):
     low_freq_component, high_freq_component :
         The PSD value or array for acceleration and OMS noise.
     """
-    acc_noise_level = np.float64(acc_noise_level)
-    oms_noise_level = np.float64(oms_noise_level)
+    acc_noise_level = _as_float(acc_noise_level)
+    oms_noise_level = _as_float(oms_noise_level)
     low_freq_component = psd_tianqin_acc_noise(f, acc_noise_level)
     high_freq_component = psd_tianqin_oms_noise(f, oms_noise_level)
 
@@ -289,9 +445,9 @@ def taiji_psd_components(f, acc_noise_level=3e-15, oms_noise_level=8e-12):
     ----------
     f : float or numpy.array
         The frequency or frequency range, in the unit of "Hz".
-    acc_noise_level : float
+    acc_noise_level : float or numpy.array
         The level of acceleration noise.
-    oms_noise_level : float
+    oms_noise_level : float or numpy.array
         The level of OMS noise.
 
     Returns
@@ -299,8 +455,8 @@ def taiji_psd_components(f, acc_noise_level=3e-15, oms_noise_level=8e-12):
     low_freq_component, high_freq_component :
         The PSD value or array for acceleration and OMS noise.
     """
-    acc_noise_level = np.float64(acc_noise_level)
-    oms_noise_level = np.float64(oms_noise_level)
+    acc_noise_level = _as_float(acc_noise_level)
+    oms_noise_level = _as_float(oms_noise_level)
     low_freq_component = psd_taiji_acc_noise(f, acc_noise_level)
     high_freq_component = psd_taiji_oms_noise(f, oms_noise_level)
 
@@ -323,13 +479,387 @@ def omega_length(f, len_arm=None):
     omega_len : float or numpy.array
         The value of 2*pi*f*arm_length.
     """
-    omega_len = 2*np.pi*f * len_arm/c.value
+    omega_len = (_TWO_PI*len_arm/_C) * f
 
     return omega_len
 
 
+def _tdi_trig(fr, len_arm=None):
+    """ The trigonometric terms shared by the TDI transfer functions.
+
+    Parameters
+    ----------
+    fr : float or numpy.array
+        The frequency or frequency range, in the unit of "Hz".
+    len_arm : float
+        The arm length of the detector, in the unit of "m".
+
+    Returns
+    -------
+    trig : tuple of float or numpy.array
+        sin(omega_len)**2, cos(omega_len), sin(omega_len/2)**2 and
+        sin(2*omega_len)**2, evaluated once so that they can be reused
+        across the TDI channels.
+    """
+    omega_len = omega_length(fr, len_arm)
+    sin_w = np.sin(omega_len)
+    cos_w = np.cos(omega_len)
+    # Only one sin/cos pair is evaluated, the half and double angle
+    # terms follow from sin(x/2)**2 = (1-cos(x))/2 and
+    # sin(2x)**2 = 4*sin(x)**2*cos(x)**2. Where cos(x) > 0 the former is
+    # written as sin(x)**2/(2*(1+cos(x))) to avoid the cancellation at
+    # small x. The squares are taken here once for all channels.
+    sin_sq = sin_w*sin_w
+    with np.errstate(divide='ignore', invalid='ignore'):
+        sin_half_sq = np.where(cos_w > 0, sin_sq/(2*(1+cos_w)),
+                               0.5*(1-cos_w))
+    sin_two_sq = 4*sin_sq*(cos_w*cos_w)
+    trig = (sin_sq, cos_w, sin_half_sq, sin_two_sq)
+
+    return trig
+
+
+def _memoize_grid(func):
+    """ Cache the arrays which only depend on the output grid, for the
+    common case (e.g. parameter estimation) where the models are evaluated
+    many times on one grid with only the arm length or the noise levels
+    changing. Only active when `USE_CACHING_FOR_TDI_PSDS` is True, as each
+    entry holds several full-length arrays. The cached arrays are made
+    read-only, as they are shared between calls.
+
+    Parameters
+    ----------
+    func : function
+        Returning an array, or a tuple of arrays, from hashable arguments.
+
+    Returns
+    -------
+    wrapper : function
+        The memoized function. `wrapper.cache_clear` empties the cache.
+    """
+    @functools.lru_cache(maxsize=8)
+    def cached(*args):
+        arrays = func(*args)
+        for arr in (arrays if isinstance(arrays, tuple) else (arrays,)):
+            arr.flags.writeable = False
+        return arrays
+
+    @functools.wraps(func)
+    def wrapper(*args):
+        if not USE_CACHING_FOR_TDI_PSDS:
+            return func(*args)
+        return cached(*args)
+
+    wrapper.cache_clear = cached.cache_clear
+    wrapper.cache_info = cached.cache_info
+    return wrapper
+
+
+@_memoize_grid
+def _grid(length, delta_f, low_freq_cutoff):
+    """ The frequency grid from `_frequency_grid`, cached when
+    `USE_CACHING_FOR_TDI_PSDS` is True.
+
+    Parameters
+    ----------
+    length : int
+        Length of output Frequencyseries.
+    delta_f : float
+        Frequency step for output FrequencySeries.
+    low_freq_cutoff : float
+        Low-frequency cutoff for output FrequencySeries.
+
+    Returns
+    -------
+    fr : numpy.array
+        The frequencies of the output bins, see `_frequency_grid`.
+    """
+    fr = _frequency_grid(length, delta_f, low_freq_cutoff)
+
+    return fr
+
+
+@_memoize_grid
+def _grid_trig(length, delta_f, low_freq_cutoff, len_arm):
+    """ The trigonometric terms from `_tdi_trig` on the grid from `_grid`,
+    cached when `USE_CACHING_FOR_TDI_PSDS` is True.
+
+    Parameters
+    ----------
+    length : int
+        Length of output Frequencyseries.
+    delta_f : float
+        Frequency step for output FrequencySeries.
+    low_freq_cutoff : float
+        Low-frequency cutoff for output FrequencySeries.
+    len_arm : float
+        The arm length of the detector, in the unit of "m".
+
+    Returns
+    -------
+    trig : tuple of numpy.array
+        The trigonometric terms, see `_tdi_trig`.
+    """
+    trig = _tdi_trig(_grid(length, delta_f, low_freq_cutoff), len_arm)
+
+    return trig
+
+
+@_memoize_grid
+def _grid_noise_shapes(length, delta_f, low_freq_cutoff, psd_components):
+    """ The acceleration and OMS noise PSDs for unit noise levels on the
+    grid from `_grid`, cached when `USE_CACHING_FOR_TDI_PSDS` is True.
+
+    Parameters
+    ----------
+    length : int
+        Length of output Frequencyseries.
+    delta_f : float
+        Frequency step for output FrequencySeries.
+    low_freq_cutoff : float
+        Low-frequency cutoff for output FrequencySeries.
+    psd_components : function
+        The detector's `*_psd_components` function.
+
+    Returns
+    -------
+    s_acc_unit, s_oms_unit : numpy.array
+        The PSDs of acceleration noise and OMS noise for unit noise levels.
+    """
+    shapes = psd_components(_grid(length, delta_f, low_freq_cutoff),
+                            1.0, 1.0)
+
+    return shapes
+
+
+def _grid_terms(length, delta_f, low_freq_cutoff, len_arm, psd_components,
+                acc_noise_level, oms_noise_level):
+    """ The trigonometric terms and the acceleration and OMS noise PSDs on
+    the grid from `_frequency_grid`. When `USE_CACHING_FOR_TDI_PSDS` is
+    True the grid-only terms are cached, and each call only scales the
+    cached noise shapes by the squared noise levels.
+
+    Parameters
+    ----------
+    length : int
+        Length of output Frequencyseries.
+    delta_f : float
+        Frequency step for output FrequencySeries.
+    low_freq_cutoff : float
+        Low-frequency cutoff for output FrequencySeries.
+    len_arm : float
+        The arm length of the detector, in the unit of "m".
+    psd_components : function
+        The detector's `*_psd_components` function. Both noise PSDs must
+        scale with the square of their noise level.
+    acc_noise_level : float
+        The level of acceleration noise.
+    oms_noise_level : float
+        The level of OMS noise.
+
+    Returns
+    -------
+    trig : tuple of numpy.array
+        The trigonometric terms, see `_tdi_trig`.
+    psd_components : tuple of numpy.array
+        The PSDs of acceleration noise and OMS noise.
+    """
+    len_arm = float(len_arm)
+    acc_noise_level = float(acc_noise_level)
+    oms_noise_level = float(oms_noise_level)
+    if not USE_CACHING_FOR_TDI_PSDS:
+        fr = _frequency_grid(length, delta_f, low_freq_cutoff)
+        return (_tdi_trig(fr, len_arm),
+                psd_components(fr, acc_noise_level, oms_noise_level))
+    trig = _grid_trig(length, delta_f, low_freq_cutoff, len_arm)
+    s_acc_unit, s_oms_unit = _grid_noise_shapes(length, delta_f,
+                                                low_freq_cutoff,
+                                                psd_components)
+    s_acc_nu = acc_noise_level**2 * s_acc_unit
+    s_oms_nu = oms_noise_level**2 * s_oms_unit
+
+    return trig, (s_acc_nu, s_oms_nu)
+
+
+def _evaluate_tdi(expression, trig, psd_components, tdi):
+    """ Evaluate a TDI transfer function with numexpr, so that the whole
+    elementwise chain runs in a single blocked, multi-threaded pass.
+    Only used for numpy arrays, other array types (e.g. CuPy) go through
+    the plain ufunc expressions and stay on their device.
+
+    Parameters
+    ----------
+    expression : str
+        The TDI-1.5 expression, in terms of `sin_sq`, `cos_w`,
+        `sin_half_sq` and `sin_two_sq` (see `_tdi_trig`), and of `s_acc`
+        and `s_oms` (the acceleration and OMS noise components).
+    trig : tuple of numpy.array
+        The trigonometric terms from `_tdi_trig`.
+    psd_components : tuple of numpy.array
+        The PSDs of acceleration noise and OMS noise.
+    tdi : str
+        The version of TDI. Choose from "1.5" or "2.0".
+
+    Returns
+    -------
+    result : numpy.array
+        The evaluated TDI-1.5/2.0 expression.
+    """
+    if str(tdi) == "2.0":
+        expression = "(%s) * 4*sin_two_sq" % expression
+    sin_sq, cos_w, sin_half_sq, sin_two_sq = trig
+    s_acc_nu, s_oms_nu = psd_components
+    local_dict = {'sin_sq': sin_sq, 'cos_w': cos_w,
+                  'sin_half_sq': sin_half_sq, 'sin_two_sq': sin_two_sq,
+                  's_acc': s_acc_nu, 's_oms': s_oms_nu}
+
+    return numexpr.evaluate(expression, local_dict=local_dict)
+
+
+def _tdi_XYZ(trig, psd_components, tdi=None):
+    """ The TDI-1.5/2.0 PSD (X,Y,Z channel), evaluated from the
+    trigonometric terms and the noise components.
+
+    Parameters
+    ----------
+    trig : tuple of array
+        The trigonometric terms from `_tdi_trig`.
+    psd_components : tuple of array
+        The PSDs of acceleration noise and OMS noise.
+    tdi : str
+        The version of TDI. Choose from "1.5" or "2.0".
+
+    Returns
+    -------
+    psd : array
+        The TDI-1.5/2.0 PSD (X,Y,Z channel).
+    """
+    sin_sq, cos_w, sin_half_sq, sin_two_sq = trig
+    s_acc_nu, s_oms_nu = psd_components
+    if numexpr is not None and isinstance(sin_sq, np.ndarray):
+        return _evaluate_tdi(
+            "16*sin_sq * (s_oms + s_acc*(4-2*sin_sq))",
+            trig, psd_components, tdi)
+    # Accumulate in place to avoid extra full-length temporaries.
+    # 3+cos(2*omega_len) = 4-2*sin(omega_len)**2
+    psd = -2*sin_sq
+    psd += 4
+    psd *= s_acc_nu
+    psd += s_oms_nu
+    psd *= 16*sin_sq
+    if str(tdi) == "2.0":
+        tdi2_factor = 4*sin_two_sq
+        psd *= tdi2_factor
+
+    return psd
+
+
+def _tdi_XY(trig, psd_components, tdi=None):
+    """ The CSD between TDI-1.5/2.0 channel X and Y, evaluated from the
+    trigonometric terms and the noise components.
+
+    Parameters
+    ----------
+    trig : tuple of array
+        The trigonometric terms from `_tdi_trig`.
+    psd_components : tuple of array
+        The PSDs of acceleration noise and OMS noise.
+    tdi : str
+        The version of TDI. Choose from "1.5" or "2.0".
+
+    Returns
+    -------
+    csd : array
+        The CSD between TDI-1.5/2.0 channel X and Y.
+    """
+    sin_sq, cos_w, sin_half_sq, sin_two_sq = trig
+    s_acc_nu, s_oms_nu = psd_components
+    if numexpr is not None and isinstance(sin_sq, np.ndarray):
+        return _evaluate_tdi(
+            "-8*sin_sq * cos_w * (s_oms+4*s_acc)",
+            trig, psd_components, tdi)
+    csd = -8*sin_sq
+    csd *= cos_w
+    csd *= s_oms_nu+4*s_acc_nu
+    if str(tdi) == "2.0":
+        tdi2_factor = 4*sin_two_sq
+        csd *= tdi2_factor
+
+    return csd
+
+
+def _tdi_AE(trig, psd_components, tdi=None):
+    """ The PSD of TDI-1.5/2.0 channel A and E, evaluated from the
+    trigonometric terms and the noise components.
+
+    Parameters
+    ----------
+    trig : tuple of array
+        The trigonometric terms from `_tdi_trig`.
+    psd_components : tuple of array
+        The PSDs of acceleration noise and OMS noise.
+    tdi : str
+        The version of TDI. Choose from "1.5" or "2.0".
+
+    Returns
+    -------
+    psd : array
+        The PSD of TDI-1.5/2.0 channel A and E.
+    """
+    sin_sq, cos_w, sin_half_sq, sin_two_sq = trig
+    s_acc_nu, s_oms_nu = psd_components
+    if numexpr is not None and isinstance(sin_sq, np.ndarray):
+        return _evaluate_tdi(
+            "8*sin_sq * (4*(1+cos_w+cos_w**2)*s_acc + (2+cos_w)*s_oms)",
+            trig, psd_components, tdi)
+    psd = (1+cos_w+cos_w**2)*4*s_acc_nu
+    psd += (2+cos_w)*s_oms_nu
+    psd *= 8*sin_sq
+    if str(tdi) == "2.0":
+        tdi2_factor = 4*sin_two_sq
+        psd *= tdi2_factor
+
+    return psd
+
+
+def _tdi_T(trig, psd_components, tdi=None):
+    """ The PSD of TDI-1.5/2.0 channel T, evaluated from the
+    trigonometric terms and the noise components.
+
+    Parameters
+    ----------
+    trig : tuple of array
+        The trigonometric terms from `_tdi_trig`.
+    psd_components : tuple of array
+        The PSDs of acceleration noise and OMS noise.
+    tdi : str
+        The version of TDI. Choose from "1.5" or "2.0".
+
+    Returns
+    -------
+    psd : array
+        The PSD of TDI-1.5/2.0 channel T.
+    """
+    sin_sq, cos_w, sin_half_sq, sin_two_sq = trig
+    s_acc_nu, s_oms_nu = psd_components
+    if numexpr is not None and isinstance(sin_sq, np.ndarray):
+        return _evaluate_tdi(
+            "32*sin_sq * sin_half_sq * (4*s_acc*sin_half_sq + s_oms)",
+            trig, psd_components, tdi)
+    psd = 4*s_acc_nu*sin_half_sq
+    psd += s_oms_nu
+    psd *= sin_half_sq
+    psd *= 32*sin_sq
+    if str(tdi) == "2.0":
+        tdi2_factor = 4*sin_two_sq
+        psd *= tdi2_factor
+
+    return psd
+
+
 def _analytical_psd_tdi_XYZ(length, delta_f, low_freq_cutoff,
-                            len_arm=None, psd_components=None, tdi=None):
+                            len_arm=None, psd_components=None, tdi=None,
+                            fr=None, trig=None):
     """ The TDI-1.5/2.0 analytical PSD (X,Y,Z channel) for TDI-based
     space-borne GW detectors.
 
@@ -343,10 +873,18 @@ def _analytical_psd_tdi_XYZ(length, delta_f, low_freq_cutoff,
         Low-frequency cutoff for output FrequencySeries.
     len_arm : float
         The arm length of the detector, in the unit of "m".
-    psd_components : numpy.array
+    psd_components : tuple of numpy.array
         The PSDs of acceleration noise and OMS noise.
     tdi : str
         The version of TDI. Choose from "1.5" or "2.0".
+    fr : numpy.array
+        The frequencies `psd_components` were evaluated at, if they are
+        not the grid from `_frequency_grid`. The result is then
+        interpolated onto the output bins.
+    trig : tuple of numpy.array
+        The trigonometric terms from `_tdi_trig` on `fr`. If not given,
+        they are computed from `fr`, or taken from `_grid_trig` if `fr`
+        is not given either.
 
     Returns
     -------
@@ -356,22 +894,21 @@ def _analytical_psd_tdi_XYZ(length, delta_f, low_freq_cutoff,
     -----
         Please see Eq.(19-20) in <LISA-LCST-SGS-TN-001> for more details.
     """
-    len_arm = np.float64(len_arm)
-    fr = np.linspace(low_freq_cutoff, (length-1)*2*delta_f, length)
-    s_acc_nu, s_oms_nu = psd_components
-    omega_len = omega_length(fr, len_arm)
-    psd = 16*(np.sin(omega_len))**2 * (s_oms_nu +
-                                       s_acc_nu*(3+np.cos(2*omega_len)))
     if str(tdi) not in ["1.5", "2.0"]:
         raise ValueError("The version of TDI, currently only for 1.5 or 2.0.")
-    if str(tdi) == "2.0":
-        tdi2_factor = 4*(np.sin(2*omega_len))**2
-        psd *= tdi2_factor
-    fseries = from_numpy_arrays(fr, psd, length, delta_f, low_freq_cutoff)
+    len_arm = float(len_arm)
+    if trig is None:
+        if fr is None:
+            trig = _grid_trig(length, delta_f, low_freq_cutoff, len_arm)
+        else:
+            trig = _tdi_trig(fr, len_arm)
+    psd = _tdi_XYZ(trig, psd_components, tdi)
+    fseries = _fseries_on_grid(psd, length, delta_f, low_freq_cutoff, fr=fr)
 
     return fseries
 
 
+@_memoize_fseries
 def analytical_psd_lisa_tdi_XYZ(length, delta_f, low_freq_cutoff,
                                 len_arm=2.5e9, acc_noise_level=3e-15,
                                 oms_noise_level=15e-12, tdi=None):
@@ -402,15 +939,16 @@ def analytical_psd_lisa_tdi_XYZ(length, delta_f, low_freq_cutoff,
     -----
         Please see Eq.(19-20) in <LISA-LCST-SGS-TN-001> for more details.
     """
-    fr = np.linspace(low_freq_cutoff, (length-1)*2*delta_f, length)
-    psd_components = np.array(lisa_psd_components(
-        fr, acc_noise_level, oms_noise_level))
+    trig, psd_components = _grid_terms(
+        length, delta_f, low_freq_cutoff, len_arm, lisa_psd_components,
+        acc_noise_level, oms_noise_level)
     fseries = _analytical_psd_tdi_XYZ(length, delta_f, low_freq_cutoff,
-                                      len_arm, psd_components, tdi)
+                                      len_arm, psd_components, tdi, trig=trig)
 
     return fseries
 
 
+@_memoize_fseries
 def analytical_psd_tianqin_tdi_XYZ(length, delta_f, low_freq_cutoff,
                                    len_arm=np.sqrt(3)*1e8,
                                    acc_noise_level=1e-15,
@@ -443,15 +981,16 @@ def analytical_psd_tianqin_tdi_XYZ(length, delta_f, low_freq_cutoff,
         Please see Table(1) in <10.1088/0264-9381/33/3/035010>
         for more details.
     """
-    fr = np.linspace(low_freq_cutoff, (length-1)*2*delta_f, length)
-    psd_components = np.array(tianqin_psd_components(
-        fr, acc_noise_level, oms_noise_level))
+    trig, psd_components = _grid_terms(
+        length, delta_f, low_freq_cutoff, len_arm, tianqin_psd_components,
+        acc_noise_level, oms_noise_level)
     fseries = _analytical_psd_tdi_XYZ(length, delta_f, low_freq_cutoff,
-                                      len_arm, psd_components, tdi)
+                                      len_arm, psd_components, tdi, trig=trig)
 
     return fseries
 
 
+@_memoize_fseries
 def analytical_psd_taiji_tdi_XYZ(length, delta_f, low_freq_cutoff,
                                  len_arm=3e9, acc_noise_level=3e-15,
                                  oms_noise_level=8e-12, tdi=None):
@@ -482,17 +1021,18 @@ def analytical_psd_taiji_tdi_XYZ(length, delta_f, low_freq_cutoff,
     -----
         Please see <10.1103/PhysRevD.107.064021> for more details.
     """
-    fr = np.linspace(low_freq_cutoff, (length-1)*2*delta_f, length)
-    psd_components = np.array(taiji_psd_components(
-        fr, acc_noise_level, oms_noise_level))
+    trig, psd_components = _grid_terms(
+        length, delta_f, low_freq_cutoff, len_arm, taiji_psd_components,
+        acc_noise_level, oms_noise_level)
     fseries = _analytical_psd_tdi_XYZ(length, delta_f, low_freq_cutoff,
-                                      len_arm, psd_components, tdi)
+                                      len_arm, psd_components, tdi, trig=trig)
 
     return fseries
 
 
 def _analytical_csd_tdi_XY(length, delta_f, low_freq_cutoff,
-                           len_arm=None, psd_components=None, tdi=None):
+                           len_arm=None, psd_components=None, tdi=None,
+                           fr=None, trig=None):
     """ The cross-spectrum density between TDI channel X and Y.
 
     Parameters
@@ -505,10 +1045,18 @@ def _analytical_csd_tdi_XY(length, delta_f, low_freq_cutoff,
         Low-frequency cutoff for output FrequencySeries.
     len_arm : float
         The arm length of the detector, in the unit of "m".
-    psd_components : numpy.array
+    psd_components : tuple of numpy.array
         The PSDs of acceleration noise and OMS noise.
     tdi : str
         The version of TDI. Choose from "1.5" or "2.0".
+    fr : numpy.array
+        The frequencies `psd_components` were evaluated at, if they are
+        not the grid from `_frequency_grid`. The result is then
+        interpolated onto the output bins.
+    trig : tuple of numpy.array
+        The trigonometric terms from `_tdi_trig` on `fr`. If not given,
+        they are computed from `fr`, or taken from `_grid_trig` if `fr`
+        is not given either.
 
     Returns
     -------
@@ -518,22 +1066,22 @@ def _analytical_csd_tdi_XY(length, delta_f, low_freq_cutoff,
     -----
         Please see Eq.(56) in <LISA-LCST-SGS-MAN-001(Radler)> for more details.
     """
-    len_arm = np.float64(len_arm)
-    fr = np.linspace(low_freq_cutoff, (length-1)*2*delta_f, length)
-    s_acc_nu, s_oms_nu = psd_components
-    omega_len = omega_length(fr, len_arm)
-    csd = (-8*np.sin(omega_len)**2 * np.cos(omega_len) *
-           (s_oms_nu+4*s_acc_nu))
     if str(tdi) not in ["1.5", "2.0"]:
         raise ValueError("The version of TDI, currently only for 1.5 or 2.0.")
-    if str(tdi) == "2.0":
-        tdi2_factor = 4*(np.sin(2*omega_len))**2
-        csd *= tdi2_factor
-    fseries = from_numpy_arrays(fr, csd, length, delta_f, low_freq_cutoff)
+    len_arm = float(len_arm)
+    if trig is None:
+        if fr is None:
+            trig = _grid_trig(length, delta_f, low_freq_cutoff, len_arm)
+        else:
+            trig = _tdi_trig(fr, len_arm)
+    csd = _tdi_XY(trig, psd_components, tdi)
+    fseries = _fseries_on_grid(csd, length, delta_f, low_freq_cutoff, fr=fr,
+                               log=False)
 
     return fseries
 
 
+@_memoize_fseries
 def analytical_csd_lisa_tdi_XY(length, delta_f, low_freq_cutoff,
                                len_arm=2.5e9, acc_noise_level=3e-15,
                                oms_noise_level=15e-12, tdi=None):
@@ -564,17 +1112,18 @@ def analytical_csd_lisa_tdi_XY(length, delta_f, low_freq_cutoff,
     -----
         Please see Eq.(56) in <LISA-LCST-SGS-MAN-001(Radler)> for more details.
     """
-    fr = np.linspace(low_freq_cutoff, (length-1)*2*delta_f, length)
-    psd_components = np.array(lisa_psd_components(
-        fr, acc_noise_level, oms_noise_level))
+    trig, psd_components = _grid_terms(
+        length, delta_f, low_freq_cutoff, len_arm, lisa_psd_components,
+        acc_noise_level, oms_noise_level)
     fseries = _analytical_csd_tdi_XY(length, delta_f, low_freq_cutoff,
-                                     len_arm, psd_components, tdi)
+                                     len_arm, psd_components, tdi, trig=trig)
 
     return fseries
 
 
 def _analytical_psd_tdi_AE(length, delta_f, low_freq_cutoff,
-                           len_arm=None, psd_components=None, tdi=None):
+                           len_arm=None, psd_components=None, tdi=None,
+                           fr=None, trig=None):
     """ The PSD of TDI-1.5/2.0 channel A and E.
 
     Parameters
@@ -587,10 +1136,18 @@ def _analytical_psd_tdi_AE(length, delta_f, low_freq_cutoff,
         Low-frequency cutoff for output FrequencySeries.
     len_arm : float
         The arm length of the detector, in the unit of "m".
-    psd_components : numpy.array
+    psd_components : tuple of numpy.array
         The PSDs of acceleration noise and OMS noise.
     tdi : str
         The version of TDI. Choose from "1.5" or "2.0".
+    fr : numpy.array
+        The frequencies `psd_components` were evaluated at, if they are
+        not the grid from `_frequency_grid`. The result is then
+        interpolated onto the output bins.
+    trig : tuple of numpy.array
+        The trigonometric terms from `_tdi_trig` on `fr`. If not given,
+        they are computed from `fr`, or taken from `_grid_trig` if `fr`
+        is not given either.
 
     Returns
     -------
@@ -600,23 +1157,21 @@ def _analytical_psd_tdi_AE(length, delta_f, low_freq_cutoff,
     -----
         Please see Eq.(58) in <LISA-LCST-SGS-MAN-001(Radler)> for more details.
     """
-    len_arm = np.float64(len_arm)
-    fr = np.linspace(low_freq_cutoff, (length-1)*2*delta_f, length)
-    s_acc_nu, s_oms_nu = psd_components
-    omega_len = omega_length(fr, len_arm)
-    psd = (8*(np.sin(omega_len))**2 *
-           (4*(1+np.cos(omega_len)+np.cos(omega_len)**2)*s_acc_nu +
-           (2+np.cos(omega_len))*s_oms_nu))
     if str(tdi) not in ["1.5", "2.0"]:
         raise ValueError("The version of TDI, currently only for 1.5 or 2.0.")
-    if str(tdi) == "2.0":
-        tdi2_factor = 4*(np.sin(2*omega_len))**2
-        psd *= tdi2_factor
-    fseries = from_numpy_arrays(fr, psd, length, delta_f, low_freq_cutoff)
+    len_arm = float(len_arm)
+    if trig is None:
+        if fr is None:
+            trig = _grid_trig(length, delta_f, low_freq_cutoff, len_arm)
+        else:
+            trig = _tdi_trig(fr, len_arm)
+    psd = _tdi_AE(trig, psd_components, tdi)
+    fseries = _fseries_on_grid(psd, length, delta_f, low_freq_cutoff, fr=fr)
 
     return fseries
 
 
+@_memoize_fseries
 def analytical_psd_lisa_tdi_AE(length, delta_f, low_freq_cutoff,
                                len_arm=2.5e9, acc_noise_level=3e-15,
                                oms_noise_level=15e-12, tdi=None):
@@ -647,15 +1202,16 @@ def analytical_psd_lisa_tdi_AE(length, delta_f, low_freq_cutoff,
     -----
         Please see Eq.(58) in <LISA-LCST-SGS-MAN-001(Radler)> for more details.
     """
-    fr = np.linspace(low_freq_cutoff, (length-1)*2*delta_f, length)
-    psd_components = np.array(lisa_psd_components(
-        fr, acc_noise_level, oms_noise_level))
+    trig, psd_components = _grid_terms(
+        length, delta_f, low_freq_cutoff, len_arm, lisa_psd_components,
+        acc_noise_level, oms_noise_level)
     fseries = _analytical_psd_tdi_AE(length, delta_f, low_freq_cutoff,
-                                     len_arm, psd_components, tdi)
+                                     len_arm, psd_components, tdi, trig=trig)
 
     return fseries
 
 
+@_memoize_fseries
 def analytical_psd_tianqin_tdi_AE(length, delta_f, low_freq_cutoff,
                                   len_arm=np.sqrt(3)*1e8,
                                   acc_noise_level=1e-15,
@@ -688,15 +1244,16 @@ def analytical_psd_tianqin_tdi_AE(length, delta_f, low_freq_cutoff,
         Please see Table(1) in <10.1088/0264-9381/33/3/035010>
         for more details.
     """
-    fr = np.linspace(low_freq_cutoff, (length-1)*2*delta_f, length)
-    psd_components = np.array(tianqin_psd_components(
-        fr, acc_noise_level, oms_noise_level))
+    trig, psd_components = _grid_terms(
+        length, delta_f, low_freq_cutoff, len_arm, tianqin_psd_components,
+        acc_noise_level, oms_noise_level)
     fseries = _analytical_psd_tdi_AE(length, delta_f, low_freq_cutoff,
-                                     len_arm, psd_components, tdi)
+                                     len_arm, psd_components, tdi, trig=trig)
 
     return fseries
 
 
+@_memoize_fseries
 def analytical_psd_taiji_tdi_AE(length, delta_f, low_freq_cutoff,
                                 len_arm=3e9, acc_noise_level=3e-15,
                                 oms_noise_level=8e-12, tdi=None):
@@ -727,17 +1284,18 @@ def analytical_psd_taiji_tdi_AE(length, delta_f, low_freq_cutoff,
     -----
         Please see <10.1103/PhysRevD.107.064021> for more details.
     """
-    fr = np.linspace(low_freq_cutoff, (length-1)*2*delta_f, length)
-    psd_components = np.array(taiji_psd_components(
-        fr, acc_noise_level, oms_noise_level))
+    trig, psd_components = _grid_terms(
+        length, delta_f, low_freq_cutoff, len_arm, taiji_psd_components,
+        acc_noise_level, oms_noise_level)
     fseries = _analytical_psd_tdi_AE(length, delta_f, low_freq_cutoff,
-                                     len_arm, psd_components, tdi)
+                                     len_arm, psd_components, tdi, trig=trig)
 
     return fseries
 
 
 def _analytical_psd_tdi_T(length, delta_f, low_freq_cutoff,
-                          len_arm=None, psd_components=None, tdi=None):
+                          len_arm=None, psd_components=None, tdi=None,
+                          fr=None, trig=None):
     """ The PSD of TDI-1.5/2.0 channel T.
 
     Parameters
@@ -750,10 +1308,18 @@ def _analytical_psd_tdi_T(length, delta_f, low_freq_cutoff,
         Low-frequency cutoff for output FrequencySeries.
     len_arm : float
         The arm length of the detector, in the unit of "m".
-    psd_components : numpy.array
+    psd_components : tuple of numpy.array
         The PSDs of acceleration noise and OMS noise.
     tdi : str
         The version of TDI. Choose from "1.5" or "2.0".
+    fr : numpy.array
+        The frequencies `psd_components` were evaluated at, if they are
+        not the grid from `_frequency_grid`. The result is then
+        interpolated onto the output bins.
+    trig : tuple of numpy.array
+        The trigonometric terms from `_tdi_trig` on `fr`. If not given,
+        they are computed from `fr`, or taken from `_grid_trig` if `fr`
+        is not given either.
 
     Returns
     -------
@@ -763,22 +1329,21 @@ def _analytical_psd_tdi_T(length, delta_f, low_freq_cutoff,
     -----
         Please see Eq.(59) in <LISA-LCST-SGS-MAN-001(Radler)> for more details.
     """
-    len_arm = np.float64(len_arm)
-    fr = np.linspace(low_freq_cutoff, (length-1)*2*delta_f, length)
-    s_acc_nu, s_oms_nu = psd_components
-    omega_len = omega_length(fr, len_arm)
-    psd = (32*np.sin(omega_len)**2 * np.sin(omega_len/2)**2 *
-           (4*s_acc_nu*np.sin(omega_len/2)**2 + s_oms_nu))
     if str(tdi) not in ["1.5", "2.0"]:
         raise ValueError("The version of TDI, currently only for 1.5 or 2.0.")
-    if str(tdi) == "2.0":
-        tdi2_factor = 4*(np.sin(2*omega_len))**2
-        psd *= tdi2_factor
-    fseries = from_numpy_arrays(fr, psd, length, delta_f, low_freq_cutoff)
+    len_arm = float(len_arm)
+    if trig is None:
+        if fr is None:
+            trig = _grid_trig(length, delta_f, low_freq_cutoff, len_arm)
+        else:
+            trig = _tdi_trig(fr, len_arm)
+    psd = _tdi_T(trig, psd_components, tdi)
+    fseries = _fseries_on_grid(psd, length, delta_f, low_freq_cutoff, fr=fr)
 
     return fseries
 
 
+@_memoize_fseries
 def analytical_psd_lisa_tdi_T(length, delta_f, low_freq_cutoff,
                               len_arm=2.5e9, acc_noise_level=3e-15,
                               oms_noise_level=15e-12, tdi=None):
@@ -809,15 +1374,16 @@ def analytical_psd_lisa_tdi_T(length, delta_f, low_freq_cutoff,
     -----
         Please see Eq.(59) in <LISA-LCST-SGS-MAN-001(Radler)> for more details.
     """
-    fr = np.linspace(low_freq_cutoff, (length-1)*2*delta_f, length)
-    psd_components = np.array(lisa_psd_components(
-        fr, acc_noise_level, oms_noise_level))
+    trig, psd_components = _grid_terms(
+        length, delta_f, low_freq_cutoff, len_arm, lisa_psd_components,
+        acc_noise_level, oms_noise_level)
     fseries = _analytical_psd_tdi_T(length, delta_f, low_freq_cutoff,
-                                    len_arm, psd_components, tdi)
+                                    len_arm, psd_components, tdi, trig=trig)
 
     return fseries
 
 
+@_memoize_fseries
 def analytical_psd_tianqin_tdi_T(length, delta_f, low_freq_cutoff,
                                  len_arm=np.sqrt(3)*1e8,
                                  acc_noise_level=1e-15,
@@ -850,15 +1416,16 @@ def analytical_psd_tianqin_tdi_T(length, delta_f, low_freq_cutoff,
         Please see Table(1) in <10.1088/0264-9381/33/3/035010>
         for more details.
     """
-    fr = np.linspace(low_freq_cutoff, (length-1)*2*delta_f, length)
-    psd_components = np.array(tianqin_psd_components(
-        fr, acc_noise_level, oms_noise_level))
+    trig, psd_components = _grid_terms(
+        length, delta_f, low_freq_cutoff, len_arm, tianqin_psd_components,
+        acc_noise_level, oms_noise_level)
     fseries = _analytical_psd_tdi_T(length, delta_f, low_freq_cutoff,
-                                    len_arm, psd_components, tdi)
+                                    len_arm, psd_components, tdi, trig=trig)
 
     return fseries
 
 
+@_memoize_fseries
 def analytical_psd_taiji_tdi_T(length, delta_f, low_freq_cutoff,
                                len_arm=3e9, acc_noise_level=3e-15,
                                oms_noise_level=8e-12, tdi=None):
@@ -889,11 +1456,248 @@ def analytical_psd_taiji_tdi_T(length, delta_f, low_freq_cutoff,
     -----
         Please see <10.1103/PhysRevD.107.064021> for more details.
     """
-    fr = np.linspace(low_freq_cutoff, (length-1)*2*delta_f, length)
-    psd_components = np.array(taiji_psd_components(
-        fr, acc_noise_level, oms_noise_level))
+    trig, psd_components = _grid_terms(
+        length, delta_f, low_freq_cutoff, len_arm, taiji_psd_components,
+        acc_noise_level, oms_noise_level)
     fseries = _analytical_psd_tdi_T(length, delta_f, low_freq_cutoff,
-                                    len_arm, psd_components, tdi)
+                                    len_arm, psd_components, tdi, trig=trig)
+
+    return fseries
+
+
+def _tdi_psd_arrays(trig, psd_components, tdi=None):
+    """ The TDI-1.5/2.0 PSDs of channel X/Y/Z, A/E and T, and the CSD
+    between channel X and Y, from a single set of trigonometric terms
+    and noise components.
+
+    Parameters
+    ----------
+    trig : tuple of array
+        The trigonometric terms from `_tdi_trig`.
+    psd_components : tuple of array
+        The PSDs of acceleration noise and OMS noise.
+    tdi : str
+        The version of TDI. Choose from "1.5" or "2.0".
+
+    Returns
+    -------
+    psd_XYZ, psd_AE, psd_T, csd_XY : array
+        The TDI-1.5/2.0 PSDs (X,Y,Z channel; A,E channel; T channel)
+        and the CSD between channel X and Y.
+    """
+    psd_XYZ = _tdi_XYZ(trig, psd_components, tdi)
+    psd_AE = _tdi_AE(trig, psd_components, tdi)
+    psd_T = _tdi_T(trig, psd_components, tdi)
+    csd_XY = _tdi_XY(trig, psd_components, tdi)
+
+    return psd_XYZ, psd_AE, psd_T, csd_XY
+
+
+def _analytical_tdi_bundle(length, delta_f, low_freq_cutoff, len_arm=None,
+                           psd_components=None, tdi=None, fr=None,
+                           trig=None):
+    """ The TDI-1.5/2.0 PSDs of channel X/Y/Z, A/E and T, and the CSD
+    between channel X and Y for TDI-based space-borne GW detectors,
+    evaluated in one pass over the frequency grid.
+
+    Parameters
+    ----------
+    length : int
+        Length of output Frequencyseries.
+    delta_f : float
+        Frequency step for output FrequencySeries.
+    low_freq_cutoff : float
+        Low-frequency cutoff for output FrequencySeries.
+    len_arm : float
+        The arm length of the detector, in the unit of "m".
+    psd_components : numpy.array
+        The PSDs of acceleration noise and OMS noise.
+    tdi : str
+        The version of TDI. Choose from "1.5" or "2.0".
+    fr : numpy.array
+        The frequencies `psd_components` were evaluated at, if they are
+        not the grid from `_frequency_grid`. The result is then
+        interpolated onto the output bins.
+    trig : tuple of numpy.array
+        The trigonometric terms from `_tdi_trig` on `fr`. If not given,
+        they are computed from `fr`, or taken from `_grid_trig` if `fr`
+        is not given either.
+
+    Returns
+    -------
+    psd_XYZ, psd_AE, psd_T, csd_XY : FrequencySeries
+        The TDI-1.5/2.0 PSDs (X,Y,Z channel; A,E channel; T channel)
+        and the CSD between channel X and Y.
+    """
+    if str(tdi) not in ["1.5", "2.0"]:
+        raise ValueError("The version of TDI, currently only for 1.5 or 2.0.")
+    len_arm = float(len_arm)
+    if trig is None:
+        if fr is None:
+            trig = _grid_trig(length, delta_f, low_freq_cutoff, len_arm)
+        else:
+            trig = _tdi_trig(fr, len_arm)
+    psd_XYZ, psd_AE, psd_T, csd_XY = _tdi_psd_arrays(trig, psd_components,
+                                                     tdi)
+    fseries = tuple(_fseries_on_grid(data, length, delta_f, low_freq_cutoff,
+                                     fr=fr)
+                    for data in (psd_XYZ, psd_AE, psd_T))
+    # The CSD is negative, so it can't be interpolated in log space.
+    fseries += (_fseries_on_grid(csd_XY, length, delta_f, low_freq_cutoff,
+                                 fr=fr, log=False),)
+
+    return fseries
+
+
+def lisa_tdi_psd_arrays(f, len_arm=2.5e9, acc_noise_level=3e-15,
+                        oms_noise_level=15e-12, tdi=None):
+    """ LISA's TDI-1.5/2.0 PSDs of channel X/Y/Z, A/E and T, and the CSD
+    between channel X and Y, evaluated directly at the given frequencies.
+
+    Only NumPy ufuncs are used, so `f` may also be e.g. a CuPy array, in
+    which case all the results stay on the GPU.
+
+    Parameters
+    ----------
+    f : numpy.array
+        The frequency range, in the unit of "Hz".
+    len_arm : float
+        The arm length of LISA, in the unit of "m".
+    acc_noise_level : float
+        The level of acceleration noise.
+    oms_noise_level : float
+        The level of OMS noise.
+    tdi : str
+        The version of TDI. Choose from "1.5" or "2.0".
+
+    Returns
+    -------
+    psd_XYZ, psd_AE, psd_T, csd_XY : numpy.array
+        The TDI-1.5/2.0 PSDs (X,Y,Z channel; A,E channel; T channel)
+        and the CSD between channel X and Y.
+    """
+    if str(tdi) not in ["1.5", "2.0"]:
+        raise ValueError("The version of TDI, currently only for 1.5 or 2.0.")
+    psd_components = lisa_psd_components(f, acc_noise_level, oms_noise_level)
+    trig = _tdi_trig(f, _as_float(len_arm))
+
+    return _tdi_psd_arrays(trig, psd_components, tdi)
+
+
+def lisa_tdi_bundle(length, delta_f, low_freq_cutoff, len_arm=2.5e9,
+                    acc_noise_level=3e-15, oms_noise_level=15e-12, tdi=None):
+    """ LISA's TDI-1.5/2.0 PSDs of channel X/Y/Z, A/E and T, and the CSD
+    between channel X and Y, sharing the noise components and trigonometric
+    terms between all channels.
+
+    Parameters
+    ----------
+    length : int
+        Length of output Frequencyseries.
+    delta_f : float
+        Frequency step for output FrequencySeries.
+    low_freq_cutoff : float
+        Low-frequency cutoff for output FrequencySeries.
+    len_arm : float
+        The arm length of LISA, in the unit of "m".
+    acc_noise_level : float
+        The level of acceleration noise.
+    oms_noise_level : float
+        The level of OMS noise.
+    tdi : str
+        The version of TDI. Choose from "1.5" or "2.0".
+
+    Returns
+    -------
+    psd_XYZ, psd_AE, psd_T, csd_XY : FrequencySeries
+        The same as `analytical_psd_lisa_tdi_XYZ`,
+        `analytical_psd_lisa_tdi_AE`, `analytical_psd_lisa_tdi_T`
+        and `analytical_csd_lisa_tdi_XY`.
+    """
+    trig, psd_components = _grid_terms(
+        length, delta_f, low_freq_cutoff, len_arm, lisa_psd_components,
+        acc_noise_level, oms_noise_level)
+    fseries = _analytical_tdi_bundle(length, delta_f, low_freq_cutoff,
+                                     len_arm, psd_components, tdi, trig=trig)
+
+    return fseries
+
+
+def tianqin_tdi_bundle(length, delta_f, low_freq_cutoff,
+                       len_arm=np.sqrt(3)*1e8, acc_noise_level=1e-15,
+                       oms_noise_level=1e-12, tdi=None):
+    """ TianQin's TDI-1.5/2.0 PSDs of channel X/Y/Z, A/E and T, and the CSD
+    between channel X and Y, sharing the noise components and trigonometric
+    terms between all channels.
+
+    Parameters
+    ----------
+    length : int
+        Length of output Frequencyseries.
+    delta_f : float
+        Frequency step for output FrequencySeries.
+    low_freq_cutoff : float
+        Low-frequency cutoff for output FrequencySeries.
+    len_arm : float
+        The arm length of TianQin, in the unit of "m".
+    acc_noise_level : float
+        The level of acceleration noise.
+    oms_noise_level : float
+        The level of OMS noise.
+    tdi : str
+        The version of TDI. Choose from "1.5" or "2.0".
+
+    Returns
+    -------
+    psd_XYZ, psd_AE, psd_T, csd_XY : FrequencySeries
+        The same as `analytical_psd_tianqin_tdi_XYZ`,
+        `analytical_psd_tianqin_tdi_AE` and `analytical_psd_tianqin_tdi_T`,
+        and the CSD between channel X and Y.
+    """
+    trig, psd_components = _grid_terms(
+        length, delta_f, low_freq_cutoff, len_arm, tianqin_psd_components,
+        acc_noise_level, oms_noise_level)
+    fseries = _analytical_tdi_bundle(length, delta_f, low_freq_cutoff,
+                                     len_arm, psd_components, tdi, trig=trig)
+
+    return fseries
+
+
+def taiji_tdi_bundle(length, delta_f, low_freq_cutoff, len_arm=3e9,
+                     acc_noise_level=3e-15, oms_noise_level=8e-12, tdi=None):
+    """ Taiji's TDI-1.5/2.0 PSDs of channel X/Y/Z, A/E and T, and the CSD
+    between channel X and Y, sharing the noise components and trigonometric
+    terms between all channels.
+
+    Parameters
+    ----------
+    length : int
+        Length of output Frequencyseries.
+    delta_f : float
+        Frequency step for output FrequencySeries.
+    low_freq_cutoff : float
+        Low-frequency cutoff for output FrequencySeries.
+    len_arm : float
+        The arm length of Taiji, in the unit of "m".
+    acc_noise_level : float
+        The level of acceleration noise.
+    oms_noise_level : float
+        The level of OMS noise.
+    tdi : str
+        The version of TDI. Choose from "1.5" or "2.0".
+
+    Returns
+    -------
+    psd_XYZ, psd_AE, psd_T, csd_XY : FrequencySeries
+        The same as `analytical_psd_taiji_tdi_XYZ`,
+        `analytical_psd_taiji_tdi_AE` and `analytical_psd_taiji_tdi_T`,
+        and the CSD between channel X and Y.
+    """
+    trig, psd_components = _grid_terms(
+        length, delta_f, low_freq_cutoff, len_arm, taiji_psd_components,
+        acc_noise_level, oms_noise_level)
+    fseries = _analytical_tdi_bundle(length, delta_f, low_freq_cutoff,
+                                     len_arm, psd_components, tdi, trig=trig)
 
     return fseries
 
@@ -989,17 +1793,15 @@ def averaged_tianqin_fplus_sq_numerical(f, len_arm=np.sqrt(3)*1e8):
          2101e-6, 3027/2*1e-5, -42373/5*1e-6, 176087e-8,
          -8023/5*1e-7, 5169e-9]
     omega_len = omega_length(f, len_arm)
-    omega_len_low_f = omega_len[omega_len < 4.1]
-    omega_len_high_f = omega_len[omega_len >= 4.1]
-    base_low_f = base[:len(omega_len_low_f)]
-    base_high_f = base[len(omega_len_low_f):]
-    low_f_modulation = np.polyval(a[::-1], omega_len_low_f)
+    low_f = omega_len < 4.1
+    high_f = ~low_f
+    fp_sq_numerical = np.empty_like(base)
+    low_f_modulation = np.polyval(a[::-1], omega_len[low_f])
     high_f_modulation = np.exp(
-        -0.322 * np.sin(2*omega_len_high_f-4.712) + 0.078
+        -0.322 * np.sin(2*omega_len[high_f]-4.712) + 0.078
     )
-    low_f_result = np.multiply(base_low_f, low_f_modulation)
-    high_f_result = np.multiply(base_high_f, high_f_modulation)
-    fp_sq_numerical = np.concatenate((low_f_result, high_f_result))
+    fp_sq_numerical[low_f] = base[low_f] * low_f_modulation
+    fp_sq_numerical[high_f] = base[high_f] * high_f_modulation
 
     return fp_sq_numerical
 
@@ -1128,18 +1930,18 @@ def sensitivity_curve_lisa_semi_analytical(length, delta_f, low_freq_cutoff,
     -----
         Please see Eq.(42-43) in <LISA-LCST-SGS-TN-001> for more details.
     """
-    len_arm = np.float64(len_arm)
-    acc_noise_level = np.float64(acc_noise_level)
-    oms_noise_level = np.float64(oms_noise_level)
-    fr = np.linspace(low_freq_cutoff, (length-1)*2*delta_f, length)
+    len_arm = float(len_arm)
+    acc_noise_level = float(acc_noise_level)
+    oms_noise_level = float(oms_noise_level)
+    fr = _frequency_grid(length, delta_f, low_freq_cutoff)
     fp_sq = averaged_lisa_fplus_sq_numerical(fr, len_arm)
     s_acc_nu, s_oms_nu = lisa_psd_components(
                             fr, acc_noise_level, oms_noise_level)
     omega_len = omega_length(fr, len_arm)
     sense_curve = ((s_oms_nu + s_acc_nu*(3+np.cos(2*omega_len))) /
                    (omega_len**2*fp_sq))
-    fseries = from_numpy_arrays(fr, sense_curve/2,
-                                length, delta_f, low_freq_cutoff)
+    fseries = _fseries_on_grid(sense_curve/2,
+                               length, delta_f, low_freq_cutoff)
 
     return fseries
 
@@ -1172,18 +1974,18 @@ def sensitivity_curve_tianqin_analytical(length, delta_f, low_freq_cutoff,
         The sky and polarization angle averaged analytical
         TianQin's sensitivity curve (6-links).
     """
-    len_arm = np.float64(len_arm)
-    acc_noise_level = np.float64(acc_noise_level)
-    oms_noise_level = np.float64(oms_noise_level)
-    fr = np.linspace(low_freq_cutoff, (length-1)*2*delta_f, length)
+    len_arm = float(len_arm)
+    acc_noise_level = float(acc_noise_level)
+    oms_noise_level = float(oms_noise_level)
+    fr = _frequency_grid(length, delta_f, low_freq_cutoff)
     fp_sq = averaged_tianqin_fplus_sq_numerical(fr, len_arm)
     s_acc_nu, s_oms_nu = tianqin_psd_components(
                             fr, acc_noise_level, oms_noise_level)
     omega_len = omega_length(fr, len_arm)
     sense_curve = ((s_oms_nu + s_acc_nu*(3+np.cos(2*omega_len))) /
                    (omega_len**2*fp_sq))
-    fseries = from_numpy_arrays(fr, sense_curve/2,
-                                length, delta_f, low_freq_cutoff)
+    fseries = _fseries_on_grid(sense_curve/2,
+                               length, delta_f, low_freq_cutoff)
 
     return fseries
 
@@ -1215,18 +2017,18 @@ def sensitivity_curve_taiji_analytical(length, delta_f, low_freq_cutoff,
         The sky and polarization angle averaged analytical
         Taiji's sensitivity curve (6-links).
     """
-    len_arm = np.float64(len_arm)
-    acc_noise_level = np.float64(acc_noise_level)
-    oms_noise_level = np.float64(oms_noise_level)
-    fr = np.linspace(low_freq_cutoff, (length-1)*2*delta_f, length)
+    len_arm = float(len_arm)
+    acc_noise_level = float(acc_noise_level)
+    oms_noise_level = float(oms_noise_level)
+    fr = _frequency_grid(length, delta_f, low_freq_cutoff)
     fp_sq = averaged_fplus_sq_approximated(fr, len_arm)
     s_acc_nu, s_oms_nu = taiji_psd_components(
                             fr, acc_noise_level, oms_noise_level)
     omega_len = omega_length(fr, len_arm)
     sense_curve = ((s_oms_nu + s_acc_nu*(3+np.cos(2*omega_len))) /
                    (omega_len**2*fp_sq))
-    fseries = from_numpy_arrays(fr, sense_curve/2,
-                                length, delta_f, low_freq_cutoff)
+    fseries = _fseries_on_grid(sense_curve/2,
+                               length, delta_f, low_freq_cutoff)
 
     return fseries
 
@@ -1253,13 +2055,14 @@ def sensitivity_curve_lisa_SciRD(length, delta_f, low_freq_cutoff):
     -----
         Please see Eq.(114) in <LISA-LCST-SGS-TN-001> for more details.
     """
-    fr = np.linspace(low_freq_cutoff, (length-1)*2*delta_f, length)
-    s_I = 5.76e-48 * (1+(4e-4/fr)**2)
+    fr = _frequency_grid(length, delta_f, low_freq_cutoff)
+    # s_I/(2*pi*f)**4, with the (2*pi)**4 folded into the scalar.
+    s_I_d = (5.76e-48/_TWO_PI**4) * (1+(4e-4/fr)**2) / fr**4
     s_II = 3.6e-41
     R = 1 + (fr/2.5e-2)**2
-    sense_curve = 10/3 * (s_I/(2*np.pi*fr)**4+s_II) * R
-    fseries = from_numpy_arrays(fr, sense_curve, length,
-                                delta_f, low_freq_cutoff)
+    sense_curve = 10/3 * (s_I_d+s_II) * R
+    fseries = _fseries_on_grid(sense_curve, length,
+                               delta_f, low_freq_cutoff)
 
     return fseries
 
@@ -1289,13 +2092,13 @@ def confusion_fit_lisa(length, delta_f, low_freq_cutoff, duration=1.0):
     -----
         Please see Eq.(85-86) in <LISA-LCST-SGS-TN-001> for more details.
     """
-    fr = np.linspace(low_freq_cutoff, (length-1)*2*delta_f, length)
+    fr = _frequency_grid(length, delta_f, low_freq_cutoff)
     f1 = 10**(-0.25*np.log10(duration)-2.7)
     fk = 10**(-0.27*np.log10(duration)-2.47)
     sh_confusion = (0.5*1.14e-44*fr**(-7/3)*np.exp(-(fr/f1)**1.8) *
                     (1.0+np.tanh((fk-fr)/0.31e-3)))
-    fseries = from_numpy_arrays(fr, sh_confusion, length, delta_f,
-                                low_freq_cutoff)
+    fseries = _fseries_on_grid(sh_confusion, length, delta_f,
+                               low_freq_cutoff)
 
     return fseries
 
@@ -1328,7 +2131,7 @@ def confusion_fit_tianqin(length, delta_f, low_freq_cutoff, duration=1.0):
         Please see Table(II) in <10.1103/PhysRevD.102.063021>
         for more details.
     """
-    fr = np.linspace(low_freq_cutoff, (length-1)*2*delta_f, length)
+    fr = _frequency_grid(length, delta_f, low_freq_cutoff)
     t_obs = [0.5, 1, 2, 4, 5]
     a0 = [-18.6, -18.6, -18.6, -18.6, -18.6]
     a1 = [-1.22, -1.13, -1.45, -1.43, -1.51]
@@ -1364,8 +2167,8 @@ def confusion_fit_tianqin(length, delta_f, low_freq_cutoff, duration=1.0):
     sh_confusion[(fr > 3e-4) & (fr < 5e-4)] = \
         sh_confusion[(np.abs(fr - 5e-4)).argmin()]
     sh_confusion[(fr < 3e-4) | (fr > 1e-2)] = 0
-    fseries = from_numpy_arrays(fr, sh_confusion, length, delta_f,
-                                low_freq_cutoff)
+    fseries = _fseries_on_grid(sh_confusion, length, delta_f,
+                               low_freq_cutoff)
 
     return fseries
 
@@ -1398,7 +2201,7 @@ def confusion_fit_taiji(length, delta_f, low_freq_cutoff, duration=1.0):
         Please see Eq.(6) and Table(I) in <10.1103/PhysRevD.107.064021>
         for more details.
     """
-    fr = np.linspace(low_freq_cutoff, (length-1)*2*delta_f, length)
+    fr = _frequency_grid(length, delta_f, low_freq_cutoff)
     t_obs = [0.5, 1, 2, 4]
     a0 = [-85.3498, -85.4336, -85.3919, -85.5448]
     a1 = [-2.64899, -2.46276, -2.69735, -3.23671]
@@ -1425,8 +2228,8 @@ def confusion_fit_taiji(length, delta_f, low_freq_cutoff, duration=1.0):
         fit_a5(duration) * np.log(fr*1e3)**5
     )
     sh_confusion[(fr < 1e-4) | (fr > 1e-2)] = 0
-    fseries = from_numpy_arrays(fr, sh_confusion, length, delta_f,
-                                low_freq_cutoff)
+    fseries = _fseries_on_grid(sh_confusion, length, delta_f,
+                               low_freq_cutoff)
 
     return fseries
 
@@ -1479,9 +2282,7 @@ def sensitivity_curve_lisa_confusion(length, delta_f, low_freq_cutoff,
         raise ValueError("Must between 0 and 10.")
     fseries_confusion = confusion_fit_lisa(
         length, delta_f, low_freq_cutoff, duration)
-    fseries = from_numpy_arrays(base_curve.sample_frequencies,
-                                base_curve+fseries_confusion,
-                                length, delta_f, low_freq_cutoff)
+    fseries = base_curve + fseries_confusion
 
     return fseries
 
@@ -1523,9 +2324,7 @@ def sensitivity_curve_tianqin_confusion(length, delta_f, low_freq_cutoff,
         raise ValueError("Must between 0 and 5.")
     fseries_confusion = confusion_fit_tianqin(
         length, delta_f, low_freq_cutoff, duration)
-    fseries = from_numpy_arrays(base_curve.sample_frequencies,
-                                base_curve+fseries_confusion,
-                                length, delta_f, low_freq_cutoff)
+    fseries = base_curve + fseries_confusion
 
     return fseries
 
@@ -1566,9 +2365,7 @@ def sensitivity_curve_taiji_confusion(length, delta_f, low_freq_cutoff,
         raise ValueError("Must between 0 and 4.")
     fseries_confusion = confusion_fit_taiji(
         length, delta_f, low_freq_cutoff, duration)
-    fseries = from_numpy_arrays(base_curve.sample_frequencies,
-                                base_curve+fseries_confusion,
-                                length, delta_f, low_freq_cutoff)
+    fseries = base_curve + fseries_confusion
 
     return fseries
 
@@ -1611,20 +2408,18 @@ def sh_transformed_psd_lisa_tdi_XYZ(length, delta_f, low_freq_cutoff,
     -----
         Please see Eq.(7,41-43) in <LISA-LCST-SGS-TN-001> for more details.
     """
-    fr = np.linspace(low_freq_cutoff, (length-1)*2*delta_f, length)
+    fr = _frequency_grid(length, delta_f, low_freq_cutoff)
     if str(tdi) in ["1.5", "2.0"]:
         response = averaged_response_lisa_tdi(fr, len_arm, tdi)
     else:
         raise ValueError("The version of TDI, currently only for 1.5 or 2.0.")
-    fseries_response = from_numpy_arrays(fr, np.array(response),
-                                         length, delta_f, low_freq_cutoff)
+    fseries_response = _fseries_on_grid(response,
+                                        length, delta_f, low_freq_cutoff)
     sh = sensitivity_curve_lisa_confusion(length, delta_f, low_freq_cutoff,
                                           len_arm, acc_noise_level,
                                           oms_noise_level, base_model,
                                           duration)
-    psd = 2*sh.data * fseries_response.data
-    fseries = from_numpy_arrays(sh.sample_frequencies, psd,
-                                length, delta_f, low_freq_cutoff)
+    fseries = 2 * sh * fseries_response
 
     return fseries
 
@@ -1656,19 +2451,16 @@ def semi_analytical_psd_lisa_confusion_noise(length, delta_f, low_freq_cutoff,
         The TDI-1.5/2.0 PSD (X,Y,Z channel) for LISA Galactic confusion
         noise, no instrumental noise.
     """
-    fr = np.linspace(low_freq_cutoff, (length-1)*2*delta_f, length)
+    fr = _frequency_grid(length, delta_f, low_freq_cutoff)
     if str(tdi) in ["1.5", "2.0"]:
         response = averaged_response_lisa_tdi(fr, len_arm, tdi)
     else:
         raise ValueError("The version of TDI, currently only for 1.5 or 2.0.")
-    fseries_response = from_numpy_arrays(fr, np.array(response),
-                                         length, delta_f, low_freq_cutoff)
+    fseries_response = _fseries_on_grid(response,
+                                        length, delta_f, low_freq_cutoff)
     fseries_confusion = confusion_fit_lisa(
         length, delta_f, low_freq_cutoff, duration)
-    psd_confusion = 2*fseries_confusion.data * fseries_response.data
-    fseries = from_numpy_arrays(fseries_confusion.sample_frequencies,
-                                psd_confusion, length, delta_f,
-                                low_freq_cutoff)
+    fseries = 2 * fseries_confusion * fseries_response
 
     return fseries
 
@@ -1700,19 +2492,16 @@ def analytical_psd_tianqin_confusion_noise(length, delta_f, low_freq_cutoff,
         The TDI-1.5/2.0 PSD (X,Y,Z channel) for TianQin Galactic confusion
         noise, no instrumental noise.
     """
-    fr = np.linspace(low_freq_cutoff, (length-1)*2*delta_f, length)
+    fr = _frequency_grid(length, delta_f, low_freq_cutoff)
     if str(tdi) in ["1.5", "2.0"]:
         response = averaged_response_tianqin_tdi(fr, len_arm, tdi)
     else:
         raise ValueError("The version of TDI, currently only for 1.5 or 2.0.")
-    fseries_response = from_numpy_arrays(fr, np.array(response),
-                                         length, delta_f, low_freq_cutoff)
+    fseries_response = _fseries_on_grid(response,
+                                        length, delta_f, low_freq_cutoff)
     fseries_confusion = confusion_fit_tianqin(
         length, delta_f, low_freq_cutoff, duration)
-    psd_confusion = 2*fseries_confusion.data * fseries_response.data
-    fseries = from_numpy_arrays(fseries_confusion.sample_frequencies,
-                                psd_confusion, length, delta_f,
-                                low_freq_cutoff)
+    fseries = 2 * fseries_confusion * fseries_response
 
     return fseries
 
@@ -1744,19 +2533,16 @@ def analytical_psd_taiji_confusion_noise(length, delta_f, low_freq_cutoff,
         The TDI-1.5/2.0 PSD (X,Y,Z channel) for Taiji Galactic confusion
         noise, no instrumental noise.
     """
-    fr = np.linspace(low_freq_cutoff, (length-1)*2*delta_f, length)
+    fr = _frequency_grid(length, delta_f, low_freq_cutoff)
     if str(tdi) in ["1.5", "2.0"]:
         response = averaged_response_taiji_tdi(fr, len_arm, tdi)
     else:
         raise ValueError("The version of TDI, currently only for 1.5 or 2.0.")
-    fseries_response = from_numpy_arrays(fr, np.array(response),
-                                         length, delta_f, low_freq_cutoff)
+    fseries_response = _fseries_on_grid(response,
+                                        length, delta_f, low_freq_cutoff)
     fseries_confusion = confusion_fit_taiji(
         length, delta_f, low_freq_cutoff, duration)
-    psd_confusion = 2*fseries_confusion.data * fseries_response.data
-    fseries = from_numpy_arrays(fseries_confusion.sample_frequencies,
-                                psd_confusion, length, delta_f,
-                                low_freq_cutoff)
+    fseries = 2 * fseries_confusion * fseries_response
 
     return fseries
 
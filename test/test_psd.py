@@ -75,6 +75,180 @@ class TestPSD(unittest.TestCase):
                 self.assertTrue(psd.min() < 1e-40,
                                 msg=(psd_name + ': unreasonably high minimum'))
 
+    def test_analytical_space(self):
+        """Test the space-borne TDI PSDs against their closed form"""
+        from pycbc.psd import analytical_space
+        delta_f = 1e-5
+        kmin = 10
+        with self.context:
+            for tdi in ('1.5', '2.0'):
+                psd = analytical_space.analytical_psd_lisa_tdi_XYZ(
+                    self.psd_len, delta_f, kmin * delta_f, tdi=tdi)
+                freqs = numpy.arange(kmin, self.psd_len) * delta_f
+                s_acc, s_oms = analytical_space.lisa_psd_components(freqs)
+                omega_len = analytical_space.omega_length(freqs, 2.5e9)
+                expected = 16 * numpy.sin(omega_len) ** 2 * \
+                    (s_oms + s_acc * (3 + numpy.cos(2 * omega_len)))
+                if tdi == '2.0':
+                    expected *= 4 * numpy.sin(2 * omega_len) ** 2
+                self.assertEqual(abs(psd.numpy()[:kmin]).max(), 0)
+                numpy.testing.assert_allclose(psd.numpy()[kmin:], expected,
+                                              rtol=1e-10)
+                # a cutoff which is not a multiple of delta_f, where bin
+                # kmin takes the value at the cutoff itself
+                psd = analytical_space.analytical_psd_lisa_tdi_XYZ(
+                    self.psd_len, delta_f, (kmin + 0.5) * delta_f, tdi=tdi)
+                freqs[0] = (kmin + 0.5) * delta_f
+                s_acc, s_oms = analytical_space.lisa_psd_components(freqs)
+                omega_len = analytical_space.omega_length(freqs, 2.5e9)
+                expected = 16 * numpy.sin(omega_len) ** 2 * \
+                    (s_oms + s_acc * (3 + numpy.cos(2 * omega_len)))
+                if tdi == '2.0':
+                    expected *= 4 * numpy.sin(2 * omega_len) ** 2
+                self.assertEqual(abs(psd.numpy()[:kmin]).max(), 0)
+                numpy.testing.assert_allclose(psd.numpy()[kmin:], expected,
+                                              rtol=1e-10)
+                freqs[0] = kmin * delta_f
+                # scalar frequencies give the same values as arrays
+                arrays = analytical_space.lisa_tdi_psd_arrays(freqs, tdi=tdi)
+                scalars = analytical_space.lisa_tdi_psd_arrays(freqs[-1],
+                                                               tdi=tdi)
+                for array, scalar in zip(arrays, scalars):
+                    self.assertAlmostEqual(scalar / array[-1], 1, places=12)
+            # noise levels may be given per frequency
+            levels = numpy.linspace(1e-15, 5e-15, len(freqs))
+            for name in ('lisa', 'tianqin', 'taiji'):
+                components = getattr(analytical_space,
+                                     name + '_psd_components')
+                s_acc, s_oms = components(freqs, levels, 2 * levels)
+                self.assertAlmostEqual(
+                    s_acc[-1] / components(freqs[-1], levels[-1])[0], 1,
+                    places=12)
+                self.assertAlmostEqual(
+                    s_oms[-1] / components(freqs[-1],
+                                           oms_noise_level=2*levels[-1])[1],
+                    1, places=12)
+
+    def test_analytical_space_numpy(self):
+        """Test the numexpr and plain numpy TDI channel evaluations agree"""
+        from pycbc.psd import analytical_space
+        if analytical_space.numexpr is None:
+            self.skipTest('numexpr is not installed')
+        freqs = numpy.arange(10, self.psd_len) * 1e-5
+        trig = analytical_space._tdi_trig(freqs, 2.5e9)
+        psd_components = analytical_space.lisa_psd_components(freqs)
+        kernels = (analytical_space._tdi_XYZ, analytical_space._tdi_XY,
+                   analytical_space._tdi_AE, analytical_space._tdi_T)
+        tdis = ('1.5', '2.0')
+        fused = [kernel(trig, psd_components, tdi)
+                 for tdi in tdis for kernel in kernels]
+        self.addCleanup(setattr, analytical_space, 'numexpr',
+                        analytical_space.numexpr)
+        analytical_space.numexpr = None
+        plain = [kernel(trig, psd_components, tdi)
+                 for tdi in tdis for kernel in kernels]
+        for fused_psd, plain_psd in zip(fused, plain):
+            numpy.testing.assert_allclose(plain_psd, fused_psd, rtol=1e-13)
+
+    def test_analytical_space_bundle(self):
+        """Test the TDI bundles against the single-channel models"""
+        from pycbc.psd import analytical_space
+        args = (self.psd_len, 1e-5, 1e-4)
+        freqs = numpy.arange(10, self.psd_len) * 1e-5
+        len_arms = {'lisa': 2.5e9, 'tianqin': numpy.sqrt(3) * 1e8,
+                    'taiji': 3e9}
+        with self.context:
+            for det, len_arm in len_arms.items():
+                bundle_func = getattr(analytical_space, det + '_tdi_bundle')
+                single = [getattr(analytical_space,
+                                  'analytical_psd_%s_tdi_%s' % (det, chan))
+                          for chan in ('XYZ', 'AE', 'T')]
+                s_acc, s_oms = getattr(analytical_space,
+                                       det + '_psd_components')(freqs)
+                omega_len = analytical_space.omega_length(freqs, len_arm)
+                for tdi in ('1.5', '2.0'):
+                    bundle = bundle_func(*args, tdi=tdi)
+                    self.assertEqual(len(bundle), 4)
+                    for fseries, func in zip(bundle, single):
+                        numpy.testing.assert_allclose(
+                            fseries.numpy(), func(*args, tdi=tdi).numpy(),
+                            rtol=1e-12)
+                    csd = bundle[3].numpy()
+                    self.assertTrue(numpy.isfinite(csd).all())
+                    expected = -8 * numpy.sin(omega_len) ** 2 * \
+                        numpy.cos(omega_len) * (s_oms + 4 * s_acc)
+                    if tdi == '2.0':
+                        expected *= 4 * numpy.sin(2 * omega_len) ** 2
+                    numpy.testing.assert_allclose(csd[10:], expected,
+                                                  rtol=1e-10)
+                    if det == 'lisa':
+                        numpy.testing.assert_allclose(
+                            csd, analytical_space.analytical_csd_lisa_tdi_XY(
+                                *args, tdi=tdi).numpy(), rtol=1e-12)
+            # a cutoff which is not a multiple of delta_f
+            freqs[0] = 1.05e-4
+            s_acc, s_oms = analytical_space.lisa_psd_components(freqs)
+            omega_len = analytical_space.omega_length(freqs, 2.5e9)
+            expected = -8 * numpy.sin(omega_len) ** 2 * \
+                numpy.cos(omega_len) * (s_oms + 4 * s_acc)
+            csd = analytical_space.lisa_tdi_bundle(
+                self.psd_len, 1e-5, 1.05e-4, tdi='1.5')[3]
+            self.assertEqual(abs(csd.numpy()[:10]).max(), 0)
+            numpy.testing.assert_allclose(csd.numpy()[10:], expected,
+                                          rtol=1e-10)
+            # frequencies given by the caller are interpolated
+            fine = analytical_space._frequency_grid(2 * args[0],
+                                                    args[1] / 2, args[2])
+            csd_fine = analytical_space._analytical_csd_tdi_XY(
+                *args, len_arm=2.5e9, tdi='1.5', fr=fine,
+                psd_components=analytical_space.lisa_psd_components(fine))
+            numpy.testing.assert_allclose(
+                csd_fine.numpy(), analytical_space.analytical_csd_lisa_tdi_XY(
+                    *args, tdi='1.5').numpy(), rtol=1e-10)
+
+    def test_analytical_space_cache(self):
+        """Test that cached space-borne PSDs are returned as copies"""
+        from pycbc.psd import analytical_space
+        args = (self.psd_len, 1e-5, 1e-4)
+        self.assertFalse(analytical_space.USE_CACHING_FOR_TDI_PSDS)
+        grid_caches = (analytical_space._grid, analytical_space._grid_trig,
+                       analytical_space._grid_noise_shapes)
+        for cache in grid_caches:
+            cache.cache_clear()
+        with self.context:
+            analytical_space.lisa_tdi_bundle(*args, tdi='1.5')
+        for cache in grid_caches:
+            self.assertEqual(cache.cache_info().currsize, 0)
+        analytical_space.USE_CACHING_FOR_TDI_PSDS = True
+        self.addCleanup(setattr, analytical_space,
+                        'USE_CACHING_FOR_TDI_PSDS', False)
+        with self.context:
+            psd1 = analytical_space.analytical_psd_lisa_tdi_AE(*args,
+                                                               tdi='1.5')
+            expected = psd1.numpy().copy()
+            psd1.data[:] = 0
+            psd2 = analytical_space.analytical_psd_lisa_tdi_AE(*args,
+                                                               tdi='1.5')
+            numpy.testing.assert_array_equal(psd2.numpy(), expected)
+            # the cached grid terms must not leak between noise settings
+            kwargs = dict(len_arm=2e9, acc_noise_level=2e-15,
+                          oms_noise_level=10e-12, tdi='1.5')
+            psd3 = analytical_space.analytical_psd_lisa_tdi_AE(*args,
+                                                               **kwargs)
+            expected = analytical_space.lisa_tdi_psd_arrays(
+                analytical_space._frequency_grid(*args), **kwargs)[1]
+            numpy.testing.assert_allclose(psd3.numpy()[10:], expected,
+                                          rtol=1e-12)
+            # nor be used with frequencies given by the caller
+            fine = analytical_space._frequency_grid(2 * args[0],
+                                                    args[1] / 2, args[2])
+            psd4 = analytical_space._analytical_psd_tdi_AE(
+                *args, len_arm=2e9, tdi='1.5', fr=fine,
+                psd_components=analytical_space.lisa_psd_components(
+                    fine, 2e-15, 10e-12))
+            numpy.testing.assert_allclose(psd4.numpy(), psd3.numpy(),
+                                          rtol=1e-10)
+
     def test_read(self):
         """Test reading PSDs from text files"""
         test_data = numpy.zeros((self.psd_len, 2))